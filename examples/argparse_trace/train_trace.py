@@ -1,12 +1,18 @@
 import examples.myapp.pipeline as pipeline  # registers @tunable
-from jsonargparse import ArgumentParser
+from examples.myapp.schema_flags import write_schema_if_requested
 
 from tunablex import use_config
 from tunablex.runtime import load_config_for_entry
 from tunablex.runtime import schema_for_entrypoint
-from tunablex.runtime import write_schema
+
+TRAIN_MAIN = pipeline.train_main
 
 if __name__ == "__main__":
+    # Fast path: --gen-schema alone does not need the CLI parser
+    write_schema_if_requested(schema_for_entrypoint, TRAIN_MAIN, require_config=True)
+
+    from jsonargparse import ArgumentParser
+
     parser = ArgumentParser(prog="train_trace")
     parser.add_argument("--config", required=True, help="Path to train_config.json")
     parser.add_argument(
@@ -17,11 +23,6 @@ if __name__ == "__main__":
     )
     args = parser.parse_args()
 
-    if args.gen_schema:
-        schema, defaults = schema_for_entrypoint(pipeline.train_main)
-        write_schema(args.schema_prefix, schema, defaults)
-        print(f"Wrote {args.schema_prefix}.schema.json and {args.schema_prefix}.json")
-    else:
-        cfg = load_config_for_entry(pipeline.train_main, args.config)  # no app tags needed
-        with use_config(cfg):
-            pipeline.train_main()
+    cfg = load_config_for_entry(TRAIN_MAIN, args.config)  # no app tags needed
+    with use_config(cfg):
+        TRAIN_MAIN()
@@ -5,6 +5,8 @@ from tunablex import use_config
 from tunablex.cli_helpers import add_flags_by_app
 from tunablex.cli_helpers import build_cfg_from_file_and_args
 
+TRAIN_MAIN = pipeline.train_main
+
 if __name__ == "__main__":
     # Use app-tag based flag generation since we know we're the 'train' app.
     parser = ArgumentParser(prog="train_jsonarg_app")
@@ -19,4 +21,4 @@ if __name__ == "__main__":
     cfg = AppConfig.model_validate(cfg_dict)
 
     with use_config(cfg):
-        pipeline.train_main()
+        TRAIN_MAIN()
@@ -5,12 +5,14 @@ from tunablex import use_config
 from tunablex.cli_helpers import add_flags_by_entry
 from tunablex.cli_helpers import build_cfg_from_file_and_args
 
+TRAIN_MAIN = pipeline.train_main
+
 if __name__ == "__main__":
     parser = ArgumentParser(prog="train_jsonarg_trace")
     parser.add_argument("--config", help="Path to train_config.json (optional)")
 
     # add_flags_by_trace returns the AppConfig model after adding flags
-    AppConfig = add_flags_by_entry(parser, pipeline.train_main)
+    AppConfig = add_flags_by_entry(parser, TRAIN_MAIN)
 
     args = parser.parse_args()
 
@@ -18,4 +20,4 @@ if __name__ == "__main__":
     cfg = AppConfig.model_validate(cfg_dict)
 
     with use_config(cfg):
-        pipeline.train_main()
+        TRAIN_MAIN()
@@ -6,15 +6,17 @@ Preprocess(Model) -> "model.preprocess"
 Train(Main) -> "train"
 """
 
-from __future__ import annotations
-
-from collections.abc import Sequence  # noqa: TC003
+from collections.abc import Sequence
 from typing import Literal
+from typing import TypeAlias
 
 from pydantic import Field
 
 from tunablex import TunableParams
 
+Normalization: TypeAlias = Literal["zscore", "minmax", "none"]
+"""Normalization strategies."""
+
 
 class MainParams(TunableParams):
     """Root for centralized tunable namespaces ("main")."""
@@ -29,7 +31,7 @@ class PreprocessParams(TunableParams):
     """
 
     dropna: bool = Field(True, description="Drop rows with missing values")
-    normalize: Literal["zscore", "minmax", "none"] = Field("zscore", description="Normalization strategy")
+    normalize: Normalization = Field("zscore", description="Normalization strategy")
     clip_outliers: float = Field(3.0, ge=0, le=10, description="Clip values beyond k standard deviations")
 
 
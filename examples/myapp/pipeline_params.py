@@ -5,8 +5,6 @@ are registered by inferring namespace from default expressions like
 `param=Model.hidden_units`.
 """
 
-from __future__ import annotations
-
 from typing import Literal
 
 from tunablex import tunable
@@ -1,7 +1,5 @@
 """Preprocessing step with tunable parameters under a nested namespace."""
 
-from __future__ import annotations
-
 from typing import Literal
 
 from pydantic import Field
@@ -22,6 +20,7 @@ from .pipeline_submodule import submodule_fun
 def preprocess(
     path: str,
     dropna: bool = Field(True, description="Drop rows with missing values"),
+    # Same values as params.Normalization, spelled out: ruff B008 cannot see through the alias to accept Field
     normalize: Literal["zscore", "minmax", "none"] = Field("zscore", description="Normalization strategy"),
     clip_outliers: float = Field(3.0, ge=0, le=10, description="Clip values beyond k standard deviations"),
 ):
@@ -0,0 +1,30 @@
+"""Shared `--gen-schema` fast path of the example training scripts."""
+
+import argparse
+import sys
+
+from tunablex.runtime import write_schema
+
+
+def write_schema_if_requested(make_schema, *args, require_config: bool = False) -> None:
+    """Write the schema and defaults from `make_schema(*args)` and exit, when the command line only asks for them.
+
+    Generating the schema does not need the CLI parser (nor importing jsonargparse). A minimal argparse parser reads
+    the same options, so every spelling of them works (e.g. --schema-prefix=out); anything it cannot handle alone
+    (help, unknown or malformed arguments) is left to the script's full parser.
+    """
+    pre = argparse.ArgumentParser(add_help=False, exit_on_error=False)
+    pre.add_argument("--config")
+    pre.add_argument("--gen-schema", action="store_true")
+    pre.add_argument("--schema-prefix", default="train_config")
+    try:
+        known, rest = pre.parse_known_args()
+    except argparse.ArgumentError:
+        return
+    if not known.gen_schema or rest or (require_config and known.config is None):
+        return
+    prefix = known.schema_prefix
+    schema, defaults = make_schema(*args)
+    write_schema(prefix, schema, defaults)
+    print(f"Wrote {prefix}.schema.json and {prefix}.json")
+    sys.exit(0)
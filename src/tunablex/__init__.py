@@ -1,17 +1,52 @@
 """Tunablex API."""
 
-from .cli_helpers import add_flags_by_app as add_flags_by_app
-from .cli_helpers import add_flags_by_entry as add_flags_by_entry
-from .cli_helpers import build_cfg_from_file_and_args as build_cfg_from_file_and_args
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
 from .context import use_config as use_config
 from .decorators import TunableParams as TunableParams
 from .decorators import TunableParamsMeta as TunableParamsMeta
 from .decorators import tunable as tunable
 from .registry import REGISTRY as REGISTRY
-from .runtime import load_config_for_app as load_config_for_app
-from .runtime import load_config_for_entry as load_config_for_entry
-from .runtime import make_config_for_app as make_config_for_app
-from .runtime import make_config_for_entry as make_config_for_entry
-from .runtime import schema_for_app as schema_for_app
-from .runtime import schema_for_entrypoint as schema_for_entrypoint
-from .runtime import write_schema as write_schema
+
+if TYPE_CHECKING:
+    from .cli_helpers import add_flags_by_app as add_flags_by_app
+    from .cli_helpers import add_flags_by_entry as add_flags_by_entry
+    from .cli_helpers import build_cfg_from_file_and_args as build_cfg_from_file_and_args
+    from .runtime import load_config_for_app as load_config_for_app
+    from .runtime import load_config_for_entry as load_config_for_entry
+    from .runtime import make_config_for_app as make_config_for_app
+    from .runtime import make_config_for_entry as make_config_for_entry
+    from .runtime import schema_for_app as schema_for_app
+    from .runtime import schema_for_entrypoint as schema_for_entrypoint
+    from .runtime import write_schema as write_schema
+
+# Exports resolved on first access (PEP 562), so that `from tunablex import tunable` does not load the CLI helpers
+_LAZY_EXPORTS = {  # noqa: RUF067
+    "add_flags_by_app": ".cli_helpers",
+    "add_flags_by_entry": ".cli_helpers",
+    "build_cfg_from_file_and_args": ".cli_helpers",
+    "load_config_for_app": ".runtime",
+    "load_config_for_entry": ".runtime",
+    "make_config_for_app": ".runtime",
+    "make_config_for_entry": ".runtime",
+    "schema_for_app": ".runtime",
+    "schema_for_entrypoint": ".runtime",
+    "write_schema": ".runtime",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # Later accesses skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_EXPORTS})
@@ -2,17 +2,25 @@ from __future__ import annotations
 
 import argparse
 import importlib
-import json
 import sys
 
+from .io import dumps_json
 from .runtime import schema_for_app
 from .runtime import schema_for_entrypoint
 from .runtime import write_schema
 
 
+def _cached_import(name: str):
+    """Return an imported module, skipping the import machinery when it is already loaded."""
+    module = sys.modules.get(name)
+    if module is None:
+        module = importlib.import_module(name)
+    return module
+
+
 def _import_modules(mods):
     for m in mods:
-        importlib.import_module(m)
+        _cached_import(m)
 
 
 def _add_sys_paths(paths):
@@ -50,19 +58,17 @@ def main(argv=None):
         if args.out:
             write_schema(args.out, schema, defaults)
         else:
-            print(json.dumps({"schema": schema, "defaults": defaults}, indent=2, default=str))
+            print(dumps_json({"schema": schema, "defaults": defaults}).decode())
         return 0
 
     if args.cmd == "analyze":
         modname, funcname = args.entry.split(":")
-        fn = getattr(importlib.import_module(modname), funcname)
-        schema, defaults, touched = schema_for_entrypoint(fn)
+        fn = getattr(_cached_import(modname), funcname)
+        schema, defaults = schema_for_entrypoint(fn)
         if args.out:
             write_schema(args.out, schema, defaults)
         else:
-            print(
-                json.dumps({"schema": schema, "defaults": defaults, "touched": sorted(touched)}, indent=2, default=str)
-            )
+            print(dumps_json({"schema": schema, "defaults": defaults}).decode())
         return 0
 
     return 1
@@ -6,25 +6,30 @@
 
 from __future__ import annotations
 
+import sys
+import weakref
 from argparse import SUPPRESS
 from argparse import BooleanOptionalAction
 from collections.abc import Sequence
 from pathlib import Path
 from typing import TYPE_CHECKING
+from typing import Any
 from typing import Literal
+from typing import NamedTuple
 from typing import get_args
 from typing import get_origin
 
 from pydantic import BaseModel
-from pydantic import Field
 
-from .io import load_structured_config
+from .io import _load_config_file
+from .runtime import _defaults_for_model
 from .runtime import make_config_for_app
 from .runtime import make_config_for_entry
 
 if TYPE_CHECKING:
     from jsonargparse import ArgumentParser
     from jsonargparse._core import ArgumentGroup
+    from pydantic.fields import FieldInfo
 
 
 def _help_with_default(fld) -> str | None:
@@ -47,46 +52,147 @@ def _is_model_type(ann) -> bool:
     return isinstance(ann, type) and issubclass(ann, BaseModel)
 
 
-def _add_field_flag(name: str, ann: type, field: Field, grp: ArgumentGroup | ArgumentParser):
-    help_text = _help_with_default(field)
-    flag = f"--{name}"
-    dest = f"TX__{name.replace('.', '__')}"
-    if get_origin(ann) is Literal:
-        grp.add_argument(flag, choices=[*get_args(ann)], dest=dest, help=help_text, default=SUPPRESS)
-    elif get_origin(ann) is Sequence or ann in (list, tuple):
-        grp.add_argument(flag, nargs="+", type=get_args(ann)[0], dest=dest, help=help_text, default=SUPPRESS)
-    elif ann is bool:
-        grp.add_argument(flag, action=BooleanOptionalAction, dest=dest, help=help_text, default=SUPPRESS)
-    elif ann in (int, float, str, Path):
-        grp.add_argument(flag, type=ann, dest=dest, help=help_text, default=SUPPRESS)
-    else:
-        grp.add_argument(flag, type=str, dest=dest, help=help_text, default=SUPPRESS)
+class FieldSpec(NamedTuple):
+    """A leaf field of an AppConfig model, as exposed on the command line."""
+
+    node_path: tuple[str, ...]
+    """Path of the section holding the field in the nested config, empty at root level."""
+
+    section: str
+    """Dotted name of the section holding the field, i.e. its argument group; empty at root level."""
+
+    name: str
+    """The field's name."""
+
+    flag: str
+    """The command-line flag, e.g. --model.preprocess.dropna."""
+
+    dest: str
+    """The argparse destination of the flag."""
+
+    annotation: Any
+    """The field's type annotation."""
+
+    field: FieldInfo
+    """The pydantic field."""
+
+    kind: str
+    """How the flag is parsed: "literal", "sequence", "bool", "scalar" or "str"."""
+
+    type_args: tuple
+    """The arguments of the annotation: the choices of a Literal, the item type of a sequence."""
+
+    help: str | None
+    """The help text of the flag, with the field's default."""
+
+
+class FlatModel(NamedTuple):
+    """The flattened tree of an AppConfig model."""
+
+    sections: tuple[str, ...]
+    """The dotted names of the nested sections, parents first."""
+
+    fields: tuple[FieldSpec, ...]
+    """The leaf fields, in declaration order."""
+
+    by_dest: dict[str, FieldSpec]
+    """The leaf fields keyed by their argparse destination."""
+
+
+def _classify_annotation(ann: Any) -> tuple[str, tuple]:
+    """Return the kind of flag used for a field annotation, along with the annotation's arguments."""
+    origin = get_origin(ann)
+    if origin is Literal:
+        return "literal", get_args(ann)
+    if origin is Sequence or ann in (list, tuple):
+        return "sequence", get_args(ann)
+    if ann is bool:
+        return "bool", ()
+    if ann in (int, float, str, Path):
+        return "scalar", ()
+    return "str", ()
 
 
-def _add_section_flags(section_name: str, model_type: type[BaseModel], parser: ArgumentParser) -> None:
-    grp = parser.add_argument_group(section_name)
-    for name, field in model_type.model_fields.items():
-        ann = field.annotation
-        # Recurse into nested models
-        if _is_model_type(ann):
-            _add_section_flags(f"{section_name}.{name}", model_type=ann, parser=parser)
+_FLAT_MODELS: weakref.WeakKeyDictionary[type[BaseModel], FlatModel] = weakref.WeakKeyDictionary()
+"""Flattened view per AppConfig model."""
+
+
+def _flatten_model(app_config_model: type[BaseModel]) -> FlatModel:
+    """Walk an AppConfig model once and return its sections and leaf fields.
+
+    Flag generation and override collection both iterate this flat view instead of recursing into the model.
+    """
+    flat = _FLAT_MODELS.get(app_config_model)
+    if flat is None:
+        flat = _FLAT_MODELS[app_config_model] = _walk_model(app_config_model)
+    return flat
+
+
+def _walk_model(app_config_model: type[BaseModel]) -> FlatModel:
+    """Flatten an AppConfig model into its sections and leaf fields."""
+    sections: list[str] = []
+    fields: list[FieldSpec] = []
+    # Explicit depth-first stack of (remaining fields, section path); keeps the declaration order used by --help
+    stack = [(iter(app_config_model.model_fields.items()), ())]
+    while stack:
+        items, node_path = stack[-1]
+        for name, field in items:
+            ann = field.annotation
+            path = (*node_path, name)
+            dotted = ".".join(path)
+            # Descend into nested models, resuming the current one afterwards
+            if _is_model_type(ann):
+                sections.append(dotted)
+                stack.append((iter(ann.model_fields.items()), path))
+                break
+            kind, type_args = _classify_annotation(ann)
+            fields.append(
+                FieldSpec(
+                    node_path=node_path,
+                    section=".".join(node_path),
+                    name=name,
+                    flag=f"--{dotted}",
+                    # Interned: the same string keys the parsed namespace and is looked up in collect_overrides
+                    dest=sys.intern(f"TX__{dotted.replace('.', '__')}"),
+                    annotation=ann,
+                    field=field,
+                    kind=kind,
+                    type_args=type_args,
+                    help=_help_with_default(field),
+                )
+            )
         else:
-            _add_field_flag(name=f"{section_name}.{name}", ann=ann, field=field, grp=grp)
+            stack.pop()
+    return FlatModel(sections=tuple(sections), fields=tuple(fields), by_dest={spec.dest: spec for spec in fields})
+
+
+_FLAG_OPTIONS = {
+    "literal": lambda spec: {"choices": [*spec.type_args]},
+    "sequence": lambda spec: {"nargs": "+", "type": spec.type_args[0]},
+    "bool": lambda spec: {"action": BooleanOptionalAction},
+    "scalar": lambda spec: {"type": spec.annotation},
+    "str": lambda spec: {"type": str},
+}
+"""The kind-specific add_argument options, by field kind."""
+
+
+def _add_field_flag(spec: FieldSpec, grp: ArgumentGroup | ArgumentParser):
+    options = _FLAG_OPTIONS[spec.kind](spec)
+    grp.add_argument(spec.flag, dest=spec.dest, help=spec.help, default=SUPPRESS, **options)
 
 
 def add_flags_from_model(parser: ArgumentParser, app_config_model: type[BaseModel]) -> None:
     """Create flags like --section.field for each tunable in the AppConfig model.
 
-    Recurses into nested BaseModel fields to support compounded namespaces.
-    Parser defaults are SUPPRESS so we can detect presence via hasattr(args, dest).
+    Nested BaseModel fields (compounded namespaces) each get an argument group named after their dotted path.
+    Parser defaults are SUPPRESS so we can detect presence via the dest being in vars(args).
     Actual defaults still come from the Pydantic model instance when building the config.
     """
-    for section_name, section_field in app_config_model.model_fields.items():
-        ann = section_field.annotation
-        if _is_model_type(ann):
-            _add_section_flags(section_name, model_type=ann, parser=parser)
-        else:  # Root level
-            _add_field_flag(name=section_name, ann=ann, field=section_field, grp=parser)
+    flat = _flatten_model(app_config_model)
+    groups = {section: parser.add_argument_group(section) for section in flat.sections}
+    for spec in flat.fields:
+        grp = groups[spec.section] if spec.section else parser  # Root level
+        _add_field_flag(spec, grp)
 
 
 def add_flags_by_app(parser: ArgumentParser, app: str):
@@ -107,58 +213,52 @@ def add_flags_by_entry(parser: ArgumentParser, entrypoint) -> BaseModel:  # type
 
 
 def deep_update(base: dict, extra: dict) -> dict:
-    """Recursively merge extra into base (in place) and return base."""
-    for k, v in (extra or {}).items():
-        if isinstance(v, dict) and isinstance(base.get(k), dict):
-            deep_update(base[k], v)
-        else:
-            base[k] = v
+    """Recursively merge extra into base (in place) and return base.
+
+    Nested dicts are merged with an explicit stack rather than recursive calls.
+    """
+    stack = [(base, extra)] if extra else []
+    while stack:
+        b, e = stack.pop()
+        for k, v in e.items():
+            bv = b.get(k)
+            if isinstance(v, dict) and isinstance(bv, dict):
+                stack.append((bv, v))
+            else:
+                b[k] = v
     return base
 
 
 def collect_overrides(args, app_config_model) -> dict:
     """Collect provided CLI flags into a nested overrides dict matching AppConfig."""
-
-    def is_model_type(ann) -> bool:
-        return isinstance(ann, type) and issubclass(ann, BaseModel)
-
+    by_dest = _flatten_model(app_config_model).by_dest
+    # Group the values per section first, so that each section is descended into once rather than once per flag
+    # Only the flags given on the command line are in the namespace (SUPPRESS defaults), so walk those
+    by_section: dict[tuple[str, ...], dict] = {}
+    for dest, val in vars(args).items():
+        if val is not None and (spec := by_dest.get(dest)) is not None:
+            by_section.setdefault(spec.node_path, {})[spec.name] = val
     overrides: dict = {}
-
-    def assign_path(path: list[str], name: str, value) -> None:
+    for node_path, values in by_section.items():
         cur = overrides
-        for p in path:
+        for p in node_path:
             cur = cur.setdefault(p, {})
-        cur[name] = value
-
-    def walk_section(dest_prefix: str, node_path: list[str], model_type: type[BaseModel]) -> None:
-        for name, fld in model_type.model_fields.items():
-            ann = fld.annotation
-            if is_model_type(ann):
-                walk_section(f"{dest_prefix}__{name}", [*node_path, name], ann)
-                continue
-            dest = f"TX__{dest_prefix}__{name}"
-            if hasattr(args, dest):
-                val = getattr(args, dest)
-                if val is not None:
-                    assign_path(node_path, name, val)
-
-    for section_name, section_field in app_config_model.model_fields.items():
-        section_model = section_field.annotation
-        if is_model_type(section_model):
-            walk_section(section_name, [section_name.replace("__", "_")], section_model)
-        else:  # Root level
-            dest = f"TX__{section_name}"
-            if hasattr(args, dest) and (val := getattr(args, dest)) is not None:
-                overrides[section_name] = val
-
+        cur.update(values)
     return overrides
 
 
 def build_cfg_from_file_and_args(app_config_model, args, config_attr: str = "config") -> dict:
-    """Merge defaults <- file (optional) <- CLI flags into a nested config dict."""
-    cfg = app_config_model().model_dump(mode="json")
-    path = getattr(args, config_attr, None)
+    """Merge defaults <- file (optional) <- CLI flags into a nested config dict.
+
+    The config attribute may hold a path or an already parsed dict.
+    """
+    cfg = _defaults_for_model(app_config_model)
+    args_d = vars(args)
+    path = args_d.get(config_attr)
+    # Common case: no config file and no flag given, the defaults are the config
+    if not path and not any(k.startswith("TX__") and v is not None for k, v in args_d.items()):
+        return cfg
     if path:
-        cfg = deep_update(cfg, load_structured_config(path))
+        cfg = deep_update(cfg, _load_config_file(path))
     overrides = collect_overrides(args, app_config_model)
     return deep_update(cfg, overrides)
@@ -6,6 +6,8 @@ from pydantic import BaseModel
 
 
 class use_config:
+    __slots__ = ("_tok", "cfg")
+
     def __init__(self, cfg):
         self.cfg = cfg
 
@@ -8,12 +8,13 @@ from __future__ import annotations
 
 import functools
 import inspect
+import operator
 import re
 import sys
 from typing import TYPE_CHECKING
 from typing import Any
-from typing import get_type_hints
 
+from pydantic import BaseModel
 from pydantic.fields import FieldInfo
 
 from .context import _active_cfg
@@ -21,14 +22,46 @@ from .registry import REGISTRY
 from .registry import TunableArg
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from collections.abc import Iterable
 
-    from pydantic import BaseModel
+
+_WORD_BOUNDARY = re.compile(r"(?<=[a-z])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])")
+"""Positions where an underscore is inserted when converting PascalCase to snake_case."""
 
 
 def _pascalcase_to_snake_case(ns: str) -> str:
     """Convert a namespace name from PascalCase to snake_case."""
-    return re.sub(r"(?<=[a-z])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])", "_", ns).lower()
+    return _WORD_BOUNDARY.sub("_", ns).lower()
+
+
+@functools.cache
+def _compile_annotation(annotation: str):
+    """Compile a string annotation once; the same few annotations (int, float, ...) come up across many functions."""
+    return compile(annotation, "<annotation>", "eval")
+
+
+def _field_of(cls: TunableParamsMeta, name: str) -> tuple[FieldInfo, Any] | None:
+    """Return the field `name` of a TunableParams class (inherited ones included) along with its type, if it is one.
+
+    Only the raw class dicts are searched, and only the annotation of that field is resolved (once, on first
+    access), so that other attributes never pay for it and annotations can refer to names defined later in the module.
+    """
+    fields = type.__getattribute__(cls, "_fields")
+    if (field := fields.get(name)) is not None:
+        return field
+    for klass in type.__getattribute__(cls, "__mro__"):
+        attrs = vars(klass)
+        if name not in attrs:
+            continue
+        if not isinstance(value := attrs[name], FieldInfo):
+            return None
+        typ = inspect.get_annotations(klass).get(name, Any)
+        if isinstance(typ, str):
+            typ = eval(_compile_annotation(typ), vars(sys.modules[klass.__module__]), dict(attrs))
+        fields[name] = field = (value, typ)
+        return field
+    return None
 
 
 class TunableParamsMeta(type):
@@ -37,10 +70,12 @@ class TunableParamsMeta(type):
     def __init__(cls, name, bases, attrs):  # noqa: D107
         super().__init__(name, bases, attrs)
         cls.namespace = None
+        cls._fields = {}
 
     @staticmethod
+    @functools.cache
     def _process_name(name: str) -> str:
-        """Process a class name to turn it into a namespace."""
+        """Process a class name to turn it into a namespace; names repeat for each nested class access."""
         name = _pascalcase_to_snake_case(name).replace("_params", "")
         if name == "main" or name == "root":
             name = ""
@@ -54,11 +89,12 @@ class TunableParamsMeta(type):
         if super().__getattribute__("namespace") is None:
             cls.namespace = TunableParamsMeta._process_name(super().__getattribute__("__name__"))
 
-        if isinstance(value := super().__getattribute__(name), FieldInfo):
-            globalsns = vars(sys.modules[cls.__module__])
-            typ = get_type_hints(cls, globalns=globalsns).get(name, Any)
+        if not name.startswith("__") and name not in {"namespace", "_fields"} and (field := _field_of(cls, name)):
+            value, typ = field
             return value, typ, cls.namespace, name
 
+        value = super().__getattribute__(name)
+
         # If value is a class with this metaclass, update its parent namespace
         if isinstance(value, type) and isinstance(value, TunableParamsMeta):
             value.namespace = f"{cls.namespace}.{TunableParamsMeta._process_name(name)}"
@@ -89,15 +125,50 @@ class TunableParams(metaclass=TunableParamsMeta):
     """
 
 
-def _resolve_nested_section(cfg_model: BaseModel, dotted_ns: str):
-    if not dotted_ns:  # main namespace
-        return cfg_model
-    obj = cfg_model
-    for seg in dotted_ns.split("."):
-        if obj is None or not hasattr(obj, seg):
-            return None
-        obj = getattr(obj, seg)
-    return obj
+def _root_section(cfg_model: BaseModel) -> BaseModel:
+    """Return the root of a config, the section of the empty namespace."""
+    return cfg_model
+
+
+def _section_getter(namespace: str) -> Callable[[BaseModel], Any]:
+    """Return a function reading the section of the given dotted namespace in a config."""
+    return operator.attrgetter(namespace) if namespace else _root_section
+
+
+def _resolve_nested_section(cfg_model: BaseModel, getter: Callable[[BaseModel], Any]):
+    """Return the config section read by the given getter, or None if it does not exist."""
+    try:
+        return getter(cfg_model)
+    except AttributeError:
+        return None
+
+
+_DUMPED_TYPES = (BaseModel, list, tuple, dict, set, frozenset)
+"""Field values that may hold models, and so go through model_dump before being injected."""
+
+
+def _section_values(section: BaseModel | dict, lookups: tuple[tuple[str, str], ...], kwargs: dict) -> dict:
+    """Return the values of a config section for the parameters not passed explicitly.
+
+    Model fields are read directly instead of dumping the whole section; values that are or may hold models
+    (containers included) are still dumped, so that functions receive plain dicts as before.
+    """
+    if isinstance(section, dict):
+        return {k: section[ref] for k, ref in lookups if ref in section and k not in kwargs}
+    fields = type(section).model_fields
+    values = {}
+    nested = []
+    for k, ref in lookups:
+        if ref in fields and k not in kwargs:
+            value = getattr(section, ref)
+            if isinstance(value, _DUMPED_TYPES):
+                nested.append((k, ref))
+            else:
+                values[k] = value
+    if nested:
+        dumped = section.model_dump(include={ref for _, ref in nested})
+        values.update({k: dumped[ref] for k, ref in nested})
+    return values
 
 
 def tunable(
@@ -113,18 +184,31 @@ def tunable(
     - namespace: JSON section name; defaults to an empty namespace.
     - apps: optional tags to group functions per executable/app.
     """
-    include_set = set(include or ())
-    exclude_set = {exclude} if isinstance(exclude, str) else set(exclude)
+    # Names and namespaces end up as keys of the registry and config dicts
+    include_set = frozenset(sys.intern(name) for name in include)
+    exclude_set = frozenset((exclude,) if isinstance(exclude, str) else exclude)
+    namespace = sys.intern(namespace)
     if include_set and exclude_set:
         msg = "Cannot pass both `include` and `exclude` arguments."
         raise ValueError(msg)
-    apps = {apps} if isinstance(apps, str) else set(apps)
+    apps = frozenset(sys.intern(app) for app in ((apps,) if isinstance(apps, str) else apps))
 
     def decorator(fn):
-        sig = inspect.signature(fn)
-        ns = namespace
-        namespaces = set()
-        ref_names = {}
+        fused = getattr(fn, "__tunable__", None)
+        # functools.wraps copies __tunable__ onto any decorator stacked on a tunable wrapper, so only fuse with the
+        # tunable wrapper itself: the one directly wrapping the function it records
+        if fused is not None and fused[0] is getattr(fn, "__wrapped__", None):
+            # Stacked on another @tunable: extend it and wrap the original function once
+            fn, sig, namespaces, ref_names = fused
+            namespaces = set(namespaces)
+            ref_names = dict(ref_names)
+        else:
+            sig = inspect.signature(fn)
+            namespaces = set()
+            ref_names = {}
+        annotations = None  # Read once, when a first parameter needs its annotation
+        entries = []
+        fn_names = frozenset((fn.__qualname__, f"{fn.__module__}.{fn.__qualname__}"))
         for name, p in sig.parameters.items():
             if name == "mro":
                 msg = "`mro` is a protected name, please use an other name for your tunable parameters."
@@ -139,29 +223,44 @@ def tunable(
                 selected = p.default is not inspect._empty
             if not selected:
                 continue
+            ns = namespace
             default = p.default if p.default is not inspect._empty else ...
             if isinstance(default, tuple) and isinstance(default[0], FieldInfo):
                 # The parameter is declared in a TunableParam class; retrieve type, namespace and reference name
                 default, typ, ns, ref_name = default
+                # TunableParams namespaces are built by string operations, so they are not interned yet
+                ns = sys.intern(ns)
                 if ref_name != name:
                     # Store the reference name for later look-up
                     # This allows to have different local names for the same global parameter
                     ref_names[name] = ref_name
                     name = ref_name
             else:
-                typ = inspect.get_annotations(fn, eval_str=False)[name]
-                typ = eval(typ, fn.__globals__) if isinstance(typ, str) else typ
+                if annotations is None:
+                    annotations = inspect.get_annotations(fn, eval_str=False)
+                typ = annotations[name]
+                typ = eval(_compile_annotation(typ), fn.__globals__) if isinstance(typ, str) else typ
             namespaces.add(ns)
-            REGISTRY.register(
+            entries.append(
                 TunableArg(
                     name=name,
                     typ=typ,
                     default=default,
                     namespace=ns,
-                    fn_names={fn.__qualname__, f"{fn.__module__}.{fn.__qualname__}"},
-                    apps=set(apps),
+                    fn_names=set(fn_names),  # Own copy: the registry merges into existing entries
+                    apps=apps,
                 )
             )
+        REGISTRY.register_many(entries)
+
+        # Build the section getters (C-level attribute chains) once here rather than splitting namespaces on every call
+        section_getters = tuple(_section_getter(ns) for ns in namespaces)
+        # Pair each parameter with the name it has in the config once here rather than on every call
+        lookups = tuple(
+            (k, ref_names.get(k, k))
+            for k, p in sig.parameters.items()
+            if p.kind not in (p.VAR_POSITIONAL, p.VAR_KEYWORD)
+        )
 
         @functools.wraps(fn)
         def wrapper(*args, cfg: BaseModel | dict | None = None, **kwargs):
@@ -169,32 +268,30 @@ def tunable(
             if isinstance(fn, staticmethod) and args[0].__class__.__name__ == fn.__qualname__.split(".")[0]:
                 args = args[1:]
             if cfg is not None:
-                data = cfg if isinstance(cfg, dict) else cfg.model_dump()
-                filtered = {
-                    # Get the tunable arguments from the config and retrieve the original name
-                    k: data[ref_names.get(k, k)]
-                    for k in sig.parameters
-                    if ref_names.get(k, k) in data and k not in kwargs
-                }
-                return fn(*args, **filtered, **kwargs)
-
-            cfg = _active_cfg.get()
-            if cfg is not None:
-                filtered = {}
-                for ns in namespaces:
-                    section = _resolve_nested_section(cfg, ns)
+                # Get the tunable arguments from the config and retrieve the original name
+                return fn(*args, **_section_values(cfg, lookups, kwargs), **kwargs)
+
+            # Functions without tunable parameters never look at the active config
+            if section_getters and (cfg := _active_cfg.get()) is not None:
+                filtered = None
+                for getter in section_getters:
+                    section = _resolve_nested_section(cfg, getter)
                     if section is not None:
-                        data = section if isinstance(section, dict) else section.model_dump()
-                        filtered.update({
-                            # Get the tunable arguments from the config and retrieve the original name
-                            k: data[ref_names.get(k, k)]
-                            for k in sig.parameters
-                            if ref_names.get(k, k) in data and k not in kwargs
-                        })
-                return fn(*args, **filtered, **kwargs)
+                        # Get the tunable arguments from the config and retrieve the original name
+                        values = _section_values(section, lookups, kwargs)
+                        # Most functions have a single namespace: use its values as is rather than copying them
+                        if filtered is None:
+                            filtered = values
+                        else:
+                            filtered.update(values)
+                if filtered:
+                    return fn(*args, **filtered, **kwargs)
 
             return fn(*args, **kwargs)
 
+        # Expose the already computed signature, so inspecting the wrapper does not unwrap and re-parse fn
+        wrapper.__signature__ = sig
+        wrapper.__tunable__ = (fn, sig, namespaces, ref_names)
         return wrapper
 
     return decorator
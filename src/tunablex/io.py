@@ -1,44 +1,150 @@
 from __future__ import annotations
 
+import functools
 import json
+import math
 from pathlib import Path
 from typing import Any
 
 
-def load_structured_config(path: str | Path) -> dict[str, Any]:
-    """Load JSON or YAML (and TOML when '.toml') into a dict.
-    Tries by extension first; falls back to JSON then YAML.
-    """
-    p = Path(path)
-    text = p.read_text()
-    ext = p.suffix.lower()
+@functools.cache
+def _yaml():
+    """Import PyYAML on first use only."""
+    try:
+        import yaml  # PyYAML
+    except ModuleNotFoundError as e:
+        msg = "YAML file provided but PyYAML is not installed. Install with: uv pip install '.[yaml]'"
+        raise RuntimeError(msg) from e
+    return yaml
 
-    if ext in {".yml", ".yaml"}:
-        try:
-            import yaml  # PyYAML
-        except ModuleNotFoundError as e:
-            msg = "YAML file provided but PyYAML is not installed. Install with: uv pip install '.[yaml]'"
-            raise RuntimeError(msg) from e
-        return yaml.safe_load(text) or {}
 
-    if ext == ".json":
-        return json.loads(text)
+@functools.cache
+def _orjson():
+    """Import orjson on first use only; None when it is not installed."""
+    try:
+        import orjson
+    except ModuleNotFoundError:
+        return None
+    return orjson
+
+
+@functools.cache
+def _tomllib():
+    """Import the TOML parser on first use only."""
+    try:
+        import tomllib  # Python 3.11+
+    except ModuleNotFoundError:
+        import tomli as tomllib  # type: ignore[no-redef]
+    return tomllib
 
-    if ext == ".toml":
+
+def _load_yaml(data: bytes) -> dict[str, Any]:
+    yaml = _yaml()
+    # The LibYAML parser is much faster than the pure-Python one, with the same safe semantics
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(data, Loader=loader) or {}
+
+
+def _load_toml(data: bytes) -> dict[str, Any]:
+    return _tomllib().loads(data.decode())  # type: ignore[attr-defined]
+
+
+def loads_json(data: bytes | str) -> Any:
+    """Parse JSON, using orjson when it is installed.
+
+    Documents orjson rejects but the standard library accepts (NaN, very large integers) go through `json`,
+    so that whatever dumps_json writes is read back as is.
+    """
+    orjson = _orjson()
+    if orjson is not None:
         try:
-            import tomllib  # Python 3.11+
-        except ModuleNotFoundError:
-            import tomli as tomllib  # type: ignore[no-redef]
-        return tomllib.loads(text)  # type: ignore[attr-defined]
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+_LOADERS = {".yml": _load_yaml, ".yaml": _load_yaml, ".json": loads_json, ".toml": _load_toml}
+"""Config parsers by file extension."""
+
+
+def load_structured_config(path: str | Path | dict[str, Any]) -> dict[str, Any]:
+    """Load JSON or YAML (and TOML when '.toml') into a dict.
+    Tries by extension first; falls back to JSON then YAML.
+    A dict is taken as an already parsed config and returned as is, so that a file read once can be reused.
+    """
+    if isinstance(path, dict):
+        return path
+    p = Path(path)
+    data = p.read_bytes()
+    loader = _LOADERS.get(p.suffix.lower())
+    if loader is not None:
+        return loader(data)
 
     # Fallback: try JSON then YAML
     try:
-        return json.loads(text)
+        return loads_json(data)
     except json.JSONDecodeError:
         try:
-            import yaml  # PyYAML
-
-            return yaml.safe_load(text) or {}
+            return _load_yaml(data)
         except Exception as e:
             msg = f"Could not parse config file: {p}"
             raise RuntimeError(msg) from e
+
+
+def _copy_json(data: Any) -> Any:
+    """Copy a tree of JSON values; much cheaper than copy.deepcopy as there is no memo to maintain."""
+    if isinstance(data, dict):
+        return {k: _copy_json(v) for k, v in data.items()}
+    if isinstance(data, list):
+        return [_copy_json(v) for v in data]
+    return data
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_config_file(path: Path, mtime_ns: int, size: int) -> dict:
+    """Parse a config file; the stat fields only key the cache, so an edited file is parsed again."""
+    return load_structured_config(path)
+
+
+def _load_config_file(path: str | Path | dict) -> dict:
+    """Like load_structured_config, but only parse a file again when it changed since the last load.
+
+    Returns a fresh copy of the parsed tree, so that callers may merge into it or share its values.
+    """
+    if isinstance(path, dict):
+        return _copy_json(path)
+    path = Path(path).resolve()
+    st = path.stat()
+    return _copy_json(_parse_config_file(path, st.st_mtime_ns, st.st_size))
+
+
+def _has_non_finite(data: Any) -> bool:
+    """Tell whether a tree of JSON values holds NaN or infinity."""
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return False
+
+
+def dumps_json(data: Any) -> bytes:
+    """Serialize data to indented JSON bytes, using orjson when it is installed.
+
+    Values that are not natively serializable (e.g. Path) are converted with `str`.
+    Data orjson would alter or reject (NaN and infinity written as null, integers wider than 64 bits) goes through
+    `json`, which writes them as is.
+    """
+    orjson = _orjson()
+    if orjson is not None and not _has_non_finite(data):
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(data, indent=2, default=str).encode()
@@ -9,8 +9,11 @@
 from __future__ import annotations
 
 import ast
+import functools
 import inspect
 import sys
+import threading
+import weakref
 from contextlib import suppress
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
@@ -22,28 +25,19 @@ from pydantic import create_model
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from collections.abc import Iterable
 
 
-def _gather_called_function_names(entry_fn: Callable, called: set):
-    """Return set of fully qualified function names that are reachable from entry_fn's module.
+def _collect_call_names(tree: ast.AST) -> set[str]:
+    """Collect the names of the functions called in a syntax tree, and the __init__ of the classes it defines.
 
-    This performs a simple static AST walk starting from the entry function's
-    body and collects names of function calls. It does not follow dynamic
-    dispatch or conditional imports. The goal is only to approximate which
-    @tunable-decorated functions may be used so we can compose an AppConfig
-    without executing user code.
+    Walks the tree with an explicit stack, which is cheaper than NodeVisitor's per-node method dispatch.
     """
-    try:
-        src = inspect.getsource(entry_fn)
-    except (OSError, TypeError):  # source not available
-        return
-
-    tree = ast.parse(src)
-    sub_called = set()
-
-    class CustomVisitor(ast.NodeVisitor):
-        def visit_Call(self, node: ast.Call):
-            """Add the name of called functions to the `sub_called` set."""
+    called = set()
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ast.Call):
             name_parts: list[str] = []
             cur = node.func
             while isinstance(cur, ast.Attribute):
@@ -53,25 +47,82 @@ def _gather_called_function_names(entry_fn: Callable, called: set):
                 name_parts.append(cur.id)
             fn_fullname = ".".join(reversed(name_parts))
             if fn_fullname:
-                sub_called.add(fn_fullname)
-            self.generic_visit(node)
+                called.add(fn_fullname)
+        elif isinstance(node, ast.ClassDef):
+            called.add(f"{node.name}.__init__")
+        stack.extend(ast.iter_child_nodes(node))
+    return called
 
-        def visit_ClassDef(self, node: ast.ClassDef):
-            """Add the __init__ of called classes to the `sub_called` set."""
-            sub_called.add(f"{node.name}.__init__")
-            self.generic_visit(node)
 
-    CustomVisitor().visit(tree)
-    for sub_fn_fullname in sub_called.difference(called):
-        called.add(sub_fn_fullname)
-        sub_fn_name = sub_fn_fullname.split(".")[-1]
-        with suppress(Exception):
-            sub_fn = vars(sys.modules[entry_fn.__module__]).get(sub_fn_name)
-            if sub_fn is not None:
-                _gather_called_function_names(sub_fn, called)
+@functools.cache
+def _direct_call_names(fn: Callable) -> frozenset[str]:
+    """Return the names of the functions called in fn's source, parsed once per function.
 
+    Entrypoints sharing helpers reuse their parsed calls instead of reading and parsing the source again.
+    """
+    try:
+        src = inspect.getsource(fn)
+    except (OSError, TypeError):  # source not available
+        return frozenset()
+
+    return frozenset(_collect_call_names(ast.parse(src)))
+
+
+def _gather_called_function_names(entry_fn: Callable, called: set):
+    """Return set of fully qualified function names that are reachable from entry_fn's module.
+
+    This performs a simple static AST walk starting from the entry function's
+    body and collects names of function calls. It does not follow dynamic
+    dispatch or conditional imports. The goal is only to approximate which
+    @tunable-decorated functions may be used so we can compose an AppConfig
+    without executing user code.
+    """
+    # Explicit work stack rather than recursion: long call chains cannot hit the recursion limit,
+    # and a function reached under several names is only walked once
+    visited = set()
+    stack = [entry_fn]
+    while stack:
+        fn = stack.pop()
+        for sub_fn_fullname in _direct_call_names(fn).difference(called):
+            called.add(sub_fn_fullname)
+            sub_fn_name = sub_fn_fullname.split(".")[-1]
+            with suppress(Exception):
+                sub_fn = vars(sys.modules[fn.__module__]).get(sub_fn_name)
+                if sub_fn is not None and sub_fn not in visited:
+                    visited.add(sub_fn)
+                    stack.append(sub_fn)
+
+
+def _called_function_names(entry_fn: Callable) -> frozenset[str]:
+    """Return the names of the functions reachable from entry_fn.
+
+    Not cached here: the entrypoint model built from it is, until the next registration, so helpers defined or
+    rebound since the previous walk are followed.
+    """
+    called = {entry_fn.__qualname__}
+    _gather_called_function_names(entry_fn, called)
+    return frozenset(called)
 
-@dataclass
+
+@functools.cache
+def _ancestor_paths(path: str) -> tuple[str, ...]:
+    """Return a dotted path and the paths of its ancestors, e.g. ("a", "a.b", "a.b.c") for "a.b.c"."""
+    parts = path.split(".")
+    return tuple(".".join(parts[: i + 1]) for i in range(len(parts)))
+
+
+_ALL_APPS = frozenset(("ALL",))
+
+_APPS_POOL: dict[frozenset[str], frozenset[str]] = {}
+"""Canonical instance of each distinct set of apps, shared by the entries using it."""
+
+
+def _pooled_apps(apps: frozenset[str]) -> frozenset[str]:
+    """Return the shared instance of a set of apps."""
+    return _APPS_POOL.setdefault(apps, apps)
+
+
+@dataclass(slots=True)
 class TunableArg:
     """A registered tunable argument."""
 
@@ -93,18 +144,21 @@ class TunableArg:
     namespace: str
     """The argument's namespace."""
 
-    apps: set[str]
-    """The apps where the argument is used."""
+    apps: frozenset[str]
+    """The apps where the argument is used.
+    Pooled: entries with the same apps share the same frozenset.
+    """
 
     def __post_init__(self):
         """If no app is provided, default to ALL."""
-        if not self.apps:
-            self.apps = {"ALL"}
+        self.apps = _pooled_apps(frozenset(self.apps) or _ALL_APPS)
 
 
 class Node:
     """A tree node that can store the TunableArgs associated to a namespace."""
 
+    __slots__ = ("children", "entries", "model_name", "path")
+
     entries: dict[str, TunableArg]
     """The entries of the namespace corresponding to the node."""
 
@@ -114,10 +168,14 @@ class Node:
     path: str
     """The node's full path."""
 
+    model_name: str
+    """The name of the config models built for the node."""
+
     def __init__(self, path: str):  # noqa: D107
         self.entries = {}
         self.children = {}
         self.path = path
+        self.model_name = f"{path.title().replace('_', '').replace('.', '_')}_Config"
 
 
 class TunableRegistry:
@@ -126,73 +184,194 @@ class TunableRegistry:
     entry_tree: Node
     """Tree containing the namespaces and the corresponding TunableEntry."""
 
+    _nodes: dict[str, Node]
+    """The nodes of the tree by dotted namespace, so that registrations do not walk the tree."""
+
+    version: int
+    """Incremented on each registration, so that derived results can be cached."""
+
+    _app_configs: dict[str, type[BaseModel]]
+    """AppConfig models already built per app, cleared on each registration."""
+
+    _entrypoint_configs: dict[Callable, type[BaseModel]]
+    """AppConfig models already built per entrypoint, cleared on each registration."""
+
+    _app_paths: dict[str, set[str]]
+    """Paths of the namespaces holding entries of each app, and of their ancestors, so that builds skip other branches.
+    Entries of all apps are recorded under "ALL".
+    """
+
+    _fn_paths: dict[str, set[str]]
+    """Same as _app_paths, per name of the functions using the entries, for the entrypoint builds."""
+
+    _lock: threading.RLock
+    """Serializes registrations and model builds, for tunables registered from several threads."""
+
+    _node_models: weakref.WeakValueDictionary[tuple, type[BaseModel]]
+    """Models already built per node, keyed by node path, selected entries and child models.
+    Kept across registrations: entries never change once registered, so a key always describes the same model.
+    Weakly referenced, so models no longer used by any config are released.
+    """
+
     def __init__(self) -> None:
         """Initialize empty registry."""
         self.entry_tree = Node("")
+        self._nodes = {"": self.entry_tree}
+        self.version = 0
+        self._app_configs = {}
+        self._entrypoint_configs = {}
+        self._node_models = weakref.WeakValueDictionary()
+        self._app_paths = {}
+        self._fn_paths = {}
+        self._lock = threading.RLock()
+
+    def clear_caches(self) -> None:
+        """Drop the built models and parsed sources and bump the version, so that everything is rebuilt on next use."""
+        with self._lock:
+            self._invalidate()
+            self._node_models.clear()
+            _direct_call_names.cache_clear()
+
+    def _invalidate(self) -> None:
+        """Drop the app and entrypoint models after a registration and bump the version; node models stay valid."""
+        self.version += 1
+        self._app_configs.clear()
+        self._entrypoint_configs.clear()
 
     def register(self, entry: TunableArg) -> None:
         """Register a tunable entry, merging with an existing namespace if present."""
-        node = self.entry_tree
-        if entry.namespace:
-            fullpath = entry.namespace.split(".")
+        self.register_many((entry,))
+
+    def register_many(self, entries: Iterable[TunableArg]) -> None:
+        """Register several tunable entries at once, e.g. all the tunables of a function.
+
+        The caches are invalidated once for the whole batch, and no model is built from a partially registered batch.
+        The whole batch is checked first, so that a conflicting entry leaves the registry untouched.
+        """
+        entries = tuple(entries)
+        with self._lock:
+            self._check_conflicts(entries)
+            self._invalidate()
+            for entry in entries:
+                self._register(entry)
+
+    def _check_conflicts(self, entries: tuple[TunableArg, ...]) -> None:
+        """Raise if an entry conflicts with a registered one, or with an earlier one of the batch."""
+        batch: dict[tuple[str, str], TunableArg] = {}
+        for entry in entries:
+            key = (entry.namespace, entry.name)
+            existing_entry = batch.get(key)
+            if existing_entry is None and (node := self._nodes.get(entry.namespace)) is not None:
+                existing_entry = node.entries.get(entry.name)
+            if existing_entry is None:
+                batch[key] = entry
+                continue
+
+            # Ensure the type and default are the same for already existing entries
+            if existing_entry.typ != entry.typ:
+                msg = f"Conflicting type for arg '{entry.name}' in namespace '{entry.namespace}': "
+                f"{existing_entry.typ} vs {entry.typ}"
+                raise ValueError(msg)
+            if existing_entry.default != entry.default:
+                msg = f"Conflicting default value for arg '{entry.name}' in namespace '{entry.namespace}': "
+                f"{existing_entry.default} vs {entry.default}"
+                raise ValueError(msg)
+
+    def _register(self, entry: TunableArg) -> None:
+        """Add a tunable entry to the tree, merging with an existing namespace if present.
+
+        The entry must have been checked against the registered ones with _check_conflicts.
+        """
+        node = self._nodes.get(entry.namespace)
+        if node is None:
+            # New namespace: create the missing nodes along its path once, then index it
+            node = self.entry_tree
             path = []
-            for p in fullpath:
+            for p in entry.namespace.split("."):
                 path.append(p)
-                node = node.children.setdefault(p, Node(".".join(path)))
+                child = node.children.get(p)
+                if child is None:
+                    child = node.children[p] = Node(sys.intern(".".join(path)))
+                node = child
+            self._nodes[node.path] = node
+        paths = _ancestor_paths(node.path)
+        for app in entry.apps:
+            self._app_paths.setdefault(app, set()).update(paths)
+        for fn_name in entry.fn_names:
+            self._fn_paths.setdefault(fn_name, set()).update(paths)
         existing_entry = node.entries.get(entry.name)
         if existing_entry is None:
             node.entries[entry.name] = entry
             return
 
-        # Ensure the type and default are the same for already existing entries
-        if existing_entry.typ != entry.typ:
-            msg = f"Conflicting type for arg '{entry.name}' in namespace '{entry.namespace}': "
-            f"{existing_entry.typ} vs {entry.typ}"
-            raise ValueError(msg)
-        if existing_entry.default != entry.default:
-            msg = f"Conflicting default value for arg '{entry.name}' in namespace '{entry.namespace}': "
-            f"{existing_entry.default} vs {entry.default}"
-            raise ValueError(msg)
-
         # Merge the apps and the functions
-        existing_entry.apps.update(entry.apps)
+        existing_entry.apps = _pooled_apps(existing_entry.apps | entry.apps)
         existing_entry.fn_names.update(entry.fn_names)
 
-    def build_config_for_app(self, app: str, node: Node | None = None) -> type[BaseModel]:
-        """Recursively create an AppConfig model for a given app."""
-        node = self.entry_tree if node is None else node
-        fields = {}
-        for name, entry in node.entries.items():
-            if app in entry.apps or "ALL" in entry.apps:
-                fields[name] = (entry.typ, entry.default)
+    def build_config_for_app(self, app: str) -> type[BaseModel]:
+        """Create an AppConfig model for a given app, reusing the model built by a previous call if any."""
+        with self._lock:
+            model = self._app_configs.get(app)
+            if model is None:
+                paths = self._app_paths.get(app, set()) | self._app_paths.get("ALL", set())
+                model = self._app_configs[app] = self._build_config_for_app(app, self.entry_tree, paths)
+            return model
+
+    def _node_model(self, node: Node, names: tuple[str, ...], children: dict[str, type[BaseModel]]) -> type[BaseModel]:
+        """Create the model of a node with the given entries and child models, reusing an identical one if any.
+
+        Apps and entrypoints selecting the same entries of a subtree share its models, and so do successive builds
+        when a registration only touched other namespaces.
+        """
+        key = (node.path, names, tuple(children.items()))
+        model = self._node_models.get(key)
+        if model is None:
+            fields = {name: (node.entries[name].typ, node.entries[name].default) for name in names}
+            for name, child_model in children.items():
+                fields[name] = (child_model, Field(default_factory=child_model))
+            model = self._node_models[key] = create_model(node.model_name, **fields)
+        return model
+
+    def _build_config_for_app(self, app: str, node: Node, paths: set[str]) -> type[BaseModel]:
+        """Recursively create an AppConfig model for a given app, only descending into the given node paths."""
+        names = tuple(name for name, entry in node.entries.items() if app in entry.apps or "ALL" in entry.apps)
+        children = {}
         for name, child in node.children.items():
-            child_model = self.build_config_for_app(app, child)
+            if child.path not in paths:
+                continue
+            child_model = self._build_config_for_app(app, child, paths)
             if child_model.model_fields:
-                fields[name] = (child_model, Field(default_factory=child_model))
+                children[name] = child_model
 
-        model_name = f"{node.path.title().replace('_', '').replace('.', '_')}_Config"
-        return create_model(model_name, **fields)
+        return self._node_model(node, names, children)
 
-    def _build_config_from_called(self, called: set[str], node: Node | None = None) -> type[BaseModel]:
-        """Build a config based on a the set of functions called."""
-        node = self.entry_tree if node is None else node
-        fields = {}
-        for name, entry in node.entries.items():
-            if entry.fn_names.intersection(called):
-                fields[name] = (entry.typ, entry.default)
+    def _build_config_from_called(self, called: set[str], node: Node, paths: set[str]) -> type[BaseModel]:
+        """Build a config based on a the set of functions called, only descending into the given node paths."""
+        names = tuple(name for name, entry in node.entries.items() if entry.fn_names.intersection(called))
+        children = {}
         for name, child in node.children.items():
-            child_model = self._build_config_from_called(called, child)
+            if child.path not in paths:
+                continue
+            child_model = self._build_config_from_called(called, child, paths)
             if child_model.model_fields:
-                fields[name] = (child_model, Field(default_factory=child_model))
+                children[name] = child_model
 
-        model_name = f"{node.path.title().replace('_', '').replace('.', '_')}_Config"
-        return create_model(model_name, **fields)
+        return self._node_model(node, names, children)
 
     def build_config_for_entrypoint(self, entrypoint: Callable) -> type[BaseModel]:
-        """Build a config based on all functions calls from an entry point."""
-        called = {entrypoint.__qualname__}
-        _gather_called_function_names(entrypoint, called)
-        return self._build_config_from_called(called)
+        """Build a config based on all functions calls from an entry point.
+
+        The model is reused until the next registration; the parsed source of each function is shared between walks.
+        """
+        with self._lock:
+            model = self._entrypoint_configs.get(entrypoint)
+            if model is None:
+                called = _called_function_names(entrypoint)
+                paths = set().union(*(self._fn_paths[name] for name in called if name in self._fn_paths))
+                model = self._entrypoint_configs[entrypoint] = self._build_config_from_called(
+                    called, self.entry_tree, paths
+                )
+            return model
 
 
 REGISTRY = TunableRegistry()
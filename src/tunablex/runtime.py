@@ -1,13 +1,14 @@
 from __future__ import annotations
 
-import json
+import weakref
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-import yaml
 from pydantic import ValidationError
 
-from .io import load_structured_config
+from .io import _copy_json
+from .io import _load_config_file
+from .io import dumps_json
 from .registry import REGISTRY
 
 if TYPE_CHECKING:
@@ -16,31 +17,71 @@ if TYPE_CHECKING:
     from pydantic import BaseModel
 
 
+_SCHEMA_CACHE: weakref.WeakKeyDictionary[type[BaseModel], dict] = weakref.WeakKeyDictionary()
+"""JSON schema per AppConfig model."""
+
+_DEFAULTS_CACHE: weakref.WeakKeyDictionary[type[BaseModel], dict] = weakref.WeakKeyDictionary()
+"""JSON-mode defaults per AppConfig model."""
+
+
+def _defaults_for_model(app_config_model: type[BaseModel]) -> dict:
+    """Return a fresh copy of the JSON-mode defaults of an AppConfig model, computed once per model."""
+    defaults = _DEFAULTS_CACHE.get(app_config_model)
+    if defaults is None:
+        defaults = _DEFAULTS_CACHE[app_config_model] = app_config_model().model_dump(mode="json")
+    return _copy_json(defaults)
+
+
+def _schema_and_defaults(app_config_model: type[BaseModel]) -> tuple[dict, dict]:
+    """Return fresh copies of the JSON schema and defaults of an AppConfig model, computed once per model."""
+    schema = _SCHEMA_CACHE.get(app_config_model)
+    if schema is None:
+        schema = _SCHEMA_CACHE[app_config_model] = app_config_model.model_json_schema()
+    return _copy_json(schema), _defaults_for_model(app_config_model)
+
+
 def schema_for_app(app: str) -> tuple[dict, dict]:
-    AppConfig = REGISTRY.build_config_for_app(app)
-    return AppConfig.model_json_schema(), AppConfig().model_dump(mode="json")
+    return _schema_and_defaults(REGISTRY.build_config_for_app(app))
 
 
 def schema_for_entrypoint(entrypoint: Callable) -> tuple[dict, dict]:
-    AppConfig = REGISTRY.build_config_for_entrypoint(entrypoint)
-    return AppConfig.model_json_schema(), AppConfig().model_dump(mode="json")
+    return _schema_and_defaults(REGISTRY.build_config_for_entrypoint(entrypoint))
+
+
+def _write_if_changed(path: Path, data: bytes) -> None:
+    """Write data to path, leaving the file untouched (mtime included) when it already has this content."""
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return
+    except FileNotFoundError:
+        pass
+    path.write_bytes(data)
 
 
 def write_schema(prefix: str, schema: dict, defaults: dict | None = None):
-    Path(f"{prefix}.schema.json").write_text(json.dumps(schema, indent=2, default=str))
     if defaults is not None:
-        Path(f"{prefix}.json").write_text(json.dumps(defaults, indent=2, default=str))
-        with Path(f"{prefix}.yml").open("w") as f:
-            yaml.dump(defaults, f, default_flow_style=False, sort_keys=False)
+        # Fail before writing anything, rather than leave a schema without its YAML defaults
+        try:
+            import yaml  # PyYAML, only needed here
+        except ModuleNotFoundError as e:
+            msg = "Writing YAML defaults requires PyYAML. Install with: uv pip install '.[yaml]'"
+            raise RuntimeError(msg) from e
+    _write_if_changed(Path(f"{prefix}.schema.json"), dumps_json(schema))
+    if defaults is not None:
+        _write_if_changed(Path(f"{prefix}.json"), dumps_json(defaults))
+        # The LibYAML emitter is much faster than the pure-Python one; defaults are plain JSON values either way
+        dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+        yml = yaml.dump(defaults, Dumper=dumper, default_flow_style=False, sort_keys=False)
+        _write_if_changed(Path(f"{prefix}.yml"), yml.encode())
 
 
 def make_config_for_app(app: str) -> type[BaseModel]:
     return REGISTRY.build_config_for_app(app)
 
 
-def load_config_for_app(app: str, json_path: str | Path):
+def load_config_for_app(app: str, json_path: str | Path | dict):
     AppConfig = REGISTRY.build_config_for_app(app)
-    data = load_structured_config(json_path)
+    data = _load_config_file(json_path)
     try:
         return AppConfig.model_validate(data)
     except ValidationError as e:
@@ -52,9 +93,9 @@ def make_config_for_entry(entrypoint: Callable) -> type[BaseModel]:
     return REGISTRY.build_config_for_entrypoint(entrypoint)
 
 
-def load_config_for_entry(entrypoint: Callable, json_path: str | Path):
+def load_config_for_entry(entrypoint: Callable, json_path: str | Path | dict):
     AppConfig = REGISTRY.build_config_for_entrypoint(entrypoint)
-    data = load_structured_config(json_path)
+    data = _load_config_file(json_path)
     try:
         return AppConfig.model_validate(data)
     except ValidationError as e:
@@ -12,7 +12,7 @@ def repo_root() -> pathlib.Path:
     return pathlib.Path(__file__).resolve().parents[1]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def run_example(repo_root):
     def _run(script_relpath, args):
         env = os.environ.copy()
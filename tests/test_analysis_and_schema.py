@@ -5,19 +5,25 @@ from pathlib import Path
 
 import pytest
 
+pytest.importorskip("yaml", reason="PyYAML not installed")
+
 # Updated tests for static AST analysis replacing runtime tracing.
 
 
-@pytest.mark.skipif(pytest.importorskip("yaml") is None, reason="PyYAML not installed")
-def test_analyze_generate_default_yaml(tmp_path, run_example):
-    out_prefix = tmp_path / "train_defaults"
+@pytest.fixture(scope="module")
+def train_defaults_paths(tmp_path_factory, run_example):
+    # Generated once for the tests below, which only read the files
+    out_prefix = tmp_path_factory.mktemp("analysis") / "train_defaults"
     code, _, err = run_example(
         "examples/trace_generate_schema.py",
         ["--entry", "train", "--prefix", str(out_prefix)],
     )
     assert code == 0, err
-    schema_path = Path(str(out_prefix) + ".schema.json")
-    json_path = Path(str(out_prefix) + ".json")
+    return Path(f"{out_prefix}.schema.json"), Path(f"{out_prefix}.json")
+
+
+def test_analyze_generate_default_yaml(train_defaults_paths):
+    schema_path, json_path = train_defaults_paths
     assert schema_path.exists()
     assert json_path.exists()
 
@@ -29,16 +35,8 @@ def test_analyze_generate_default_yaml(tmp_path, run_example):
     assert "submodule_class" in data["model"]["preprocess"]
 
 
-@pytest.mark.skipif(pytest.importorskip("yaml") is None, reason="PyYAML not installed")
-def test_analyze_generate_default_json_and_use(tmp_path, run_example):
-    out_prefix = tmp_path / "train_cfg"
-    code, _, err = run_example(
-        "examples/trace_generate_schema.py",
-        ["--entry", "train", "--prefix", str(out_prefix)],
-    )
-    assert code == 0, err
-
-    cfg_json = Path(str(out_prefix) + ".json")
+def test_analyze_generate_default_json_and_use(train_defaults_paths, run_example):
+    _, cfg_json = train_defaults_paths
     code, _, err = run_example(
         "examples/argparse_trace/train_trace.py",
         ["--config", str(cfg_json)],
@@ -46,7 +44,6 @@ def test_analyze_generate_default_json_and_use(tmp_path, run_example):
     assert code == 0, err
 
 
-@pytest.mark.skipif(pytest.importorskip("yaml") is None, reason="PyYAML not installed")
 def test_analyze_generate_schema_only(tmp_path, run_example):
     out_prefix = tmp_path / "serve_cfg"
     code, _, err = run_example(
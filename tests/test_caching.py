@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+import gc
+import threading
+import weakref
+from argparse import Namespace
+
+import pytest
+from pydantic import BaseModel
+from pydantic import Field
+from pydantic import create_model
+
+from tunablex import REGISTRY
+from tunablex import TunableParams
+from tunablex import build_cfg_from_file_and_args
+from tunablex import tunable
+from tunablex.cli_helpers import _flatten_model
+from tunablex.registry import TunableArg
+from tunablex.runtime import schema_for_app
+from tunablex.runtime import schema_for_entrypoint
+
+
+@tunable("a", namespace="cachetest")
+def cache_step(a: int = 1):
+    return a
+
+
+def cache_entry():
+    return cache_step()
+
+
+def late_entry():
+    return _late_helper()  # noqa: F821 - bound by the tests below
+
+
+def late_helper():
+    return late_step()  # noqa: F821 - only its name matters to the walk
+
+
+def test_entrypoint_walk_follows_helpers_defined_later(monkeypatch):
+    assert "late" not in schema_for_entrypoint(late_entry)[1]
+
+    monkeypatch.setitem(globals(), "_late_helper", late_helper)
+    REGISTRY.register(TunableArg(name="a", typ=int, default=1, fn_names={"late_step"}, namespace="late", apps=set()))
+    assert schema_for_entrypoint(late_entry)[1]["late"] == {"a": 1}
+
+
+def later_entry():
+    return _later_helper()  # noqa: F821 - bound by the test below
+
+
+def later_helper():
+    return later_step()  # noqa: F821 - only its name matters to the walk
+
+
+def test_clear_caches_follows_helpers_defined_after_first_build(monkeypatch):
+    REGISTRY.register(TunableArg(name="a", typ=int, default=1, fn_names={"later_step"}, namespace="later", apps=set()))
+    assert "later" not in schema_for_entrypoint(later_entry)[1]
+
+    # No registration in between: the entrypoint model is only rebuilt once the caches are cleared
+    monkeypatch.setitem(globals(), "_later_helper", later_helper)
+    REGISTRY.clear_caches()
+    assert schema_for_entrypoint(later_entry)[1]["later"] == {"a": 1}
+
+
+def test_entrypoint_schema_cache_invalidated_on_register():
+    _, defaults = schema_for_entrypoint(cache_entry)
+    assert defaults["cachetest"] == {"a": 1}
+
+    # Returned dicts are copies; mutating them must not leak into the cache
+    defaults["cachetest"]["a"] = 42
+    assert schema_for_entrypoint(cache_entry)[1]["cachetest"] == {"a": 1}
+
+    REGISTRY.register(
+        TunableArg(name="b", typ=int, default=2, fn_names={"cache_step"}, namespace="cachetest", apps=set())
+    )
+    schema, defaults = schema_for_entrypoint(cache_entry)
+    assert defaults["cachetest"] == {"a": 1, "b": 2}
+    assert "cachetest" in schema["properties"]
+
+
+def test_app_config_reused_until_register():
+    first = REGISTRY.build_config_for_app("cacheapp")
+    assert REGISTRY.build_config_for_app("cacheapp") is first
+
+    REGISTRY.register(TunableArg(name="c", typ=int, default=3, fn_names=set(), namespace="cacheapp", apps={"cacheapp"}))
+    rebuilt = REGISTRY.build_config_for_app("cacheapp")
+    assert rebuilt is not first
+    assert rebuilt().cacheapp.c == 3
+
+
+def test_app_schema_returns_fresh_copies():
+    schema, defaults = schema_for_app("cacheschema")
+    defaults["cachetest"]["a"] = 0
+    schema["properties"].clear()
+    schema, defaults = schema_for_app("cacheschema")
+    assert defaults["cachetest"]["a"] == 1
+    assert "cachetest" in schema["properties"]
+
+
+def test_clear_caches_rebuilds_models():
+    first = REGISTRY.build_config_for_entrypoint(cache_entry)
+    assert REGISTRY.build_config_for_entrypoint(cache_entry) is first
+    REGISTRY.clear_caches()
+    assert REGISTRY.build_config_for_entrypoint(cache_entry) is not first
+
+
+class _Section(BaseModel):
+    x: int = 1
+
+
+class _Config(BaseModel):
+    section: _Section = _Section()
+
+
+def test_build_cfg_without_flags_returns_fresh_defaults():
+    cfg = build_cfg_from_file_and_args(_Config, Namespace(config=None, other=True))
+    assert cfg == {"section": {"x": 1}}
+    cfg["section"]["x"] = 5
+    assert build_cfg_from_file_and_args(_Config, Namespace())["section"]["x"] == 1
+
+    cfg = build_cfg_from_file_and_args(_Config, Namespace(TX__section__x=7))
+    assert cfg == {"section": {"x": 7}}
+
+
+def test_build_cfg_reparses_config_file_only_when_changed(tmp_path):
+    path = tmp_path / "cfg.json"
+    path.write_text('{"section": {"x": 2}}')
+    cfg = build_cfg_from_file_and_args(_Config, Namespace(config=str(path)))
+    assert cfg == {"section": {"x": 2}}
+    cfg["section"]["x"] = 9
+    assert build_cfg_from_file_and_args(_Config, Namespace(config=str(path))) == {"section": {"x": 2}}
+
+    path.write_text('{"section": {"x": 30}}')
+    assert build_cfg_from_file_and_args(_Config, Namespace(config=str(path))) == {"section": {"x": 30}}
+
+
+def test_register_many_clears_caches_once():
+    version = REGISTRY.version
+    REGISTRY.register_many([
+        TunableArg(name=name, typ=int, default=0, fn_names=set(), namespace="batch", apps={"batchapp"})
+        for name in ("p", "q")
+    ])
+    assert REGISTRY.version == version + 1
+    assert REGISTRY.build_config_for_app("batchapp")().batch.model_dump() == {"p": 0, "q": 0}
+
+
+def test_unchanged_sections_reuse_their_models():
+    for app in ("shared1", "shared2"):
+        REGISTRY.register(TunableArg(name="s", typ=int, default=0, fn_names=set(), namespace="shared.sub", apps={app}))
+    first = REGISTRY.build_config_for_app("shared1")
+    # Same selected entries in the subtree: the section models are shared between apps
+    assert REGISTRY.build_config_for_app("shared2").model_fields["shared"].annotation is (
+        first.model_fields["shared"].annotation
+    )
+
+    REGISTRY.register(TunableArg(name="t", typ=int, default=1, fn_names=set(), namespace="other", apps={"shared1"}))
+    rebuilt = REGISTRY.build_config_for_app("shared1")
+    assert rebuilt is not first
+    assert rebuilt.model_fields["shared"].annotation is first.model_fields["shared"].annotation
+    assert rebuilt().other.t == 1
+
+
+def test_concurrent_registrations_are_all_kept():
+    def register(i):
+        REGISTRY.register_many([
+            TunableArg(name=f"v{i}", typ=int, default=i, fn_names=set(), namespace="threaded", apps={"threadapp"})
+        ])
+        REGISTRY.build_config_for_app("threadapp")
+
+    threads = [threading.Thread(target=register, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert REGISTRY.build_config_for_app("threadapp")().threaded.model_dump() == {f"v{i}": i for i in range(8)}
+
+
+def test_app_config_only_holds_app_branches():
+    REGISTRY.register(
+        TunableArg(name="u", typ=int, default=0, fn_names=set(), namespace="branch.one", apps={"branchapp"})
+    )
+    REGISTRY.register(TunableArg(name="w", typ=int, default=0, fn_names=set(), namespace="branch.two", apps={"other"}))
+    REGISTRY.register(TunableArg(name="all", typ=int, default=5, fn_names=set(), namespace="everywhere", apps={"ALL"}))
+    cfg = REGISTRY.build_config_for_app("branchapp")()
+    assert cfg.branch.model_dump() == {"one": {"u": 0}}
+    assert cfg.everywhere.all == 5
+
+
+def test_load_config_for_app_reparses_only_when_changed(tmp_path, monkeypatch):
+    from tunablex import io
+    from tunablex.runtime import load_config_for_app
+
+    calls = []
+    monkeypatch.setattr(io, "load_structured_config", lambda p: calls.append(p) or {"cachetest": {"a": 2}})
+    io._parse_config_file.cache_clear()
+    path = tmp_path / "cfg.json"
+    path.write_text("{}")
+    assert load_config_for_app("cacheschema", path).cachetest.a == 2
+    assert load_config_for_app("cacheschema", str(path)).cachetest.a == 2
+    assert len(calls) == 1
+
+    path.write_text("{ }")
+    load_config_for_app("cacheschema", path)
+    assert len(calls) == 2
+
+
+def test_entries_share_pooled_app_sets():
+    first = TunableArg(name="p1", typ=int, default=0, fn_names=set(), namespace="pool", apps={"poolapp"})
+    second = TunableArg(name="p2", typ=int, default=0, fn_names=set(), namespace="pool", apps=["poolapp"])
+    assert first.apps is second.apps
+    assert TunableArg(name="p3", typ=int, default=0, fn_names=set(), namespace="pool", apps=set()).apps == {"ALL"}
+
+
+def test_flattened_models_are_released_with_their_model():
+    model = create_model("Released_Config", section=(_Section, _Section()))
+    assert _flatten_model(model) is _flatten_model(model)
+    ref = weakref.ref(model)
+    del model
+    gc.collect()
+    assert ref() is None
+
+
+def test_conflicting_batch_leaves_registry_untouched():
+    REGISTRY.register(TunableArg(name="k", typ=int, default=0, fn_names=set(), namespace="atomic", apps={"atomicapp"}))
+    version = REGISTRY.version
+    batch = [
+        TunableArg(name="new", typ=int, default=1, fn_names={"atomic_fn"}, namespace="atomic.sub", apps={"atomicnew"}),
+        TunableArg(name="k", typ=int, default=5, fn_names=set(), namespace="atomic", apps={"atomicapp"}),
+    ]
+    with pytest.raises(ValueError, match="Conflicting default"):
+        REGISTRY.register_many(batch)
+    assert REGISTRY.version == version
+    assert "atomic" not in REGISTRY.build_config_for_app("atomicnew").model_fields
+    assert REGISTRY.build_config_for_app("atomicapp")().atomic.model_dump() == {"k": 0}
+
+    # Conflicts within the batch itself are caught as well
+    with pytest.raises(ValueError, match="Conflicting type"):
+        REGISTRY.register_many([
+            TunableArg(name="twice", typ=int, default=0, fn_names=set(), namespace="atomic", apps=set()),
+            TunableArg(name="twice", typ=str, default=0, fn_names=set(), namespace="atomic", apps=set()),
+        ])
+    assert REGISTRY.version == version
+
+
+class _SubParams(TunableParams):
+    x: _Later = Field(1)
+    broken: _Undefined = Field(2)  # noqa: F821
+
+
+class _OuterParams(TunableParams):
+    Sub = _SubParams
+
+
+class _Later(int):
+    pass
+
+
+def test_params_fields_resolve_only_their_own_annotation():
+    # Nested classes and plain attributes never evaluate the annotations of the fields
+    assert hasattr(_OuterParams, "Sub")
+    assert _OuterParams.Sub is _SubParams
+    assert not hasattr(_SubParams, "missing")
+    # A forward reference resolves once the name exists, whatever the other annotations
+    info, typ, namespace, name = _OuterParams.Sub.x
+    assert (info.default, typ, namespace, name) == (1, _Later, "_outer.sub", "x")
+    with pytest.raises(NameError):
+        _ = _SubParams.broken
@@ -2,8 +2,12 @@ from __future__ import annotations
 
 # Test chaining two @tunable decorators to split parameters across namespaces and
 # ensure help text (descriptions + defaults) is preserved for each parameter.
+import functools
+import inspect
+
 import pytest
 from jsonargparse import ArgumentParser
+from pydantic import BaseModel
 from pydantic import Field
 
 from tunablex import add_flags_by_app
@@ -67,3 +71,83 @@ def test_chained_tunable_decorators_cli_override(tmp_path):
     assert merged["chain"]["alpha"]["x"] == 10
     assert merged["chain"]["beta"]["y"] == 0.01
     assert merged["chain"]["beta"]["z"] == "sgd"
+
+
+def test_chained_tunable_decorators_are_fused():
+    # The outer decorator wraps the original function directly instead of the inner wrapper
+    assert inspect.unwrap(chained_func) is chained_func.__wrapped__
+    with use_config(make_config_for_app("chainapp")()):
+        assert chained_func() == (5, 0.1, "adam")
+
+
+def test_decorator_between_tunable_decorators_is_kept():
+    calls = []
+
+    def logged(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            calls.append(kwargs)
+            return fn(*args, **kwargs)
+
+        return wrapper
+
+    @tunable("x", namespace="sandwich.outer", apps=("sandwichapp",))
+    @logged
+    @tunable("y", namespace="sandwich.inner", apps=("sandwichapp",))
+    def sandwiched(x: int = 1, y: int = 2):
+        return x, y
+
+    cfg = make_config_for_app("sandwichapp").model_validate({"sandwich": {"outer": {"x": 3}, "inner": {"y": 4}}})
+    with use_config(cfg):
+        assert sandwiched() == (3, 4)
+    assert calls == [{"x": 3}]
+
+
+def test_chained_tunable_decorators_explicit_cfg():
+    AppConfig = make_config_for_app("chainapp")  # noqa: N806
+    cfg = AppConfig.model_validate({"chain": {"alpha": {"x": 7}}})
+    # An explicit cfg is read at its root level, be it a model or a dict
+    assert chained_func(cfg=cfg.chain.alpha, y=0.3, z="sgd") == (7, 0.3, "sgd")
+    assert chained_func(cfg={"x": 1, "y": 0.5}, z="sgd") == (1, 0.5, "sgd")
+    with use_config(cfg):
+        assert chained_func(y=0.2) == (7, 0.2, "adam")
+
+
+def test_chained_tunable_decorators_nested_use_config():
+    AppConfig = make_config_for_app("chainapp")  # noqa: N806
+    outer = AppConfig.model_validate({"chain": {"alpha": {"x": 1}}})
+    inner = AppConfig.model_validate({"chain": {"alpha": {"x": 2}, "beta": {"z": "sgd"}}})
+    with use_config(outer):
+        assert chained_func() == (1, 0.1, "adam")
+        with use_config(inner):
+            assert chained_func() == (2, 0.1, "sgd")
+        # Sections are resolved on every call, so the outer config applies again once the inner block exits
+        assert chained_func() == (1, 0.1, "adam")
+
+
+def test_section_reassigned_inside_use_config_block():
+    AppConfig = make_config_for_app("chainapp")  # noqa: N806
+    cfg = AppConfig()
+    with use_config(cfg):
+        assert chained_func()[0] == 5
+        # Config models are mutable: a section replaced inside the block is read by the next call
+        cfg.chain.alpha = type(cfg.chain.alpha)(x=1)
+        assert chained_func()[0] == 1
+
+
+class Layer(BaseModel):
+    units: int = 8
+
+
+@tunable("layers", "scale", namespace="chain.layers", apps=("chainapp",))
+def layered_func(layers: list[Layer] = Field([Layer()]), scale: float = 1.0):  # noqa: B008
+    return layers, scale
+
+
+def test_models_inside_containers_are_injected_as_dicts():
+    AppConfig = make_config_for_app("chainapp")  # noqa: N806
+    cfg = AppConfig.model_validate({"chain": {"layers": {"layers": [{"units": 2}, {"units": 3}]}}})
+    expected = ([{"units": 2}, {"units": 3}], 1.0)
+    with use_config(cfg):
+        assert layered_func() == expected
+    assert layered_func(cfg=cfg.chain.layers) == expected
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+
+
+def test_cli_analyze_prints_schema_and_defaults(repo_root):
+    # Run in a subprocess, so that importing the example registers nothing in the test process
+    env = os.environ.copy()
+    env["PYTHONPATH"] = str(repo_root)
+    cmd = [
+        sys.executable,
+        "-m",
+        "tunablex.cli",
+        "analyze",
+        "--entry",
+        "examples.myapp.pipeline:train_main",
+        "--import",
+        "examples.myapp.pipeline",
+        "--sys-path",
+        str(repo_root),
+    ]
+    proc = subprocess.run(cmd, capture_output=True, text=True, env=env)
+    assert proc.returncode == 0, proc.stderr
+    data = json.loads(proc.stdout)
+    assert data["defaults"]["train"]["epochs"] == 10
+    assert "model" in data["schema"]["properties"]
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import json
+import math
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from tunablex import io
+from tunablex.io import dumps_json
+from tunablex.io import load_structured_config
+from tunablex.io import loads_json
+from tunablex.runtime import write_schema
+
+
+def test_dumps_json_matches_stdlib_layout(monkeypatch):
+    data = {"train": {"epochs": 3, "lr": 0.5, "ckpt": Path("ckpt")}, "names": ["a", None, True]}
+    expected = json.dumps(data, indent=2, default=str).encode()
+    assert json.loads(dumps_json(data)) == json.loads(expected)
+
+    monkeypatch.setattr(io, "_orjson", lambda: None)  # force the stdlib fallback
+    assert dumps_json(data) == expected
+
+
+def test_dumps_json_keeps_values_orjson_cannot_write():
+    data = {"train": {"lr": float("nan"), "clip": [float("inf")]}, "seed": 2**70}
+    # orjson would write non-finite floats as null and rejects integers wider than 64 bits
+    assert dumps_json(data) == json.dumps(data, indent=2, default=str).encode()
+    assert dumps_json({"seed": 2**70}) == json.dumps({"seed": 2**70}, indent=2).encode()
+
+
+def test_write_schema_skips_unchanged_files(tmp_path):
+    prefix = tmp_path / "cfg"
+    write_schema(str(prefix), {"type": "object"}, {"a": 1})
+    schema_path = tmp_path / "cfg.schema.json"
+    os.utime(schema_path, ns=(0, 0))
+
+    write_schema(str(prefix), {"type": "object"}, {"a": 2})
+    assert schema_path.stat().st_mtime_ns == 0  # same content, not rewritten
+    assert json.loads((tmp_path / "cfg.json").read_text()) == {"a": 2}
+
+
+def test_write_schema_without_pyyaml_writes_nothing(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "yaml", None)  # make `import yaml` fail
+    with pytest.raises(RuntimeError, match="requires PyYAML"):
+        write_schema(str(tmp_path / "cfg"), {"type": "object"}, {"a": 1})
+    assert list(tmp_path.iterdir()) == []
+    # The schema alone does not need it
+    write_schema(str(tmp_path / "cfg"), {"type": "object"})
+    assert [p.name for p in tmp_path.iterdir()] == ["cfg.schema.json"]
+
+
+def test_load_json_config_with_and_without_orjson(tmp_path, monkeypatch):
+    path = tmp_path / "cfg.json"
+    path.write_text('{"train": {"epochs": 3, "names": ["a", null]}, "lr": NaN}')
+    for _ in range(2):
+        cfg = load_structured_config(path)
+        assert cfg["train"] == {"epochs": 3, "names": ["a", None]}
+        assert math.isnan(cfg["lr"])  # accepted by the stdlib parser only
+        monkeypatch.setattr(io, "_orjson", lambda: None)  # then force the stdlib path
+
+
+def test_json_round_trip_keeps_non_finite_and_wide_values():
+    data = {"train": {"lr": float("inf"), "clip": [1.5, None]}, "seed": 2**70, "eps": float("nan")}
+    loaded = loads_json(dumps_json(data))
+    assert math.isnan(loaded.pop("eps"))
+    assert loaded == {"train": {"lr": float("inf"), "clip": [1.5, None]}, "seed": 2**70}
+
+
+def test_load_yaml_config_with_and_without_libyaml(tmp_path, monkeypatch):
+    yaml = pytest.importorskip("yaml")
+    path = tmp_path / "cfg.yml"
+    path.write_text("train:\n  epochs: 3\n  names: [a, null]\nlr: 1.0e-3\nempty:\n")
+    for _ in range(2):
+        cfg = load_structured_config(path)
+        assert cfg == {"train": {"epochs": 3, "names": ["a", None]}, "lr": 0.001, "empty": None}
+        monkeypatch.delattr(yaml, "CSafeLoader", raising=False)  # then force the pure-Python parser
+
+
+def test_load_config_file_copies_dict_configs():
+    data = {"train": {"epochs": 3, "layers": [1, 2]}}
+    loaded = io._load_config_file(data)
+    loaded["train"]["epochs"] = 5
+    loaded["train"]["layers"].append(3)
+    assert data == {"train": {"epochs": 3, "layers": [1, 2]}}
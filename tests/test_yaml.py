@@ -1,5 +1,7 @@
 import pytest
 
+pytest.importorskip("yaml", reason="PyYAML not installed")
+
 YAML_CONTENT = """model:
   hidden_units: 512
   dropout: 0.1
@@ -14,7 +16,6 @@ train:
 """
 
 
-@pytest.mark.skipif(pytest.importorskip("yaml") is None, reason="PyYAML not installed")
 def test_yaml_config_end_to_end(tmp_path, run_example):
     cfg = tmp_path / "train_config.yaml"
     cfg.write_text(YAML_CONTENT)